@@ -0,0 +1,30 @@
+"""JSON helpers shared by the CLI and adapters, using orjson when available."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps_json(data: Any) -> str:
+    """Serialize data as 2-space indented JSON, using orjson when available.
+
+    The stdlib fallback keeps non-ASCII characters unescaped so both paths
+    write the same output.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def loads_json(content: str | bytes) -> Any:
+    """Parse JSON content, using orjson when available.
+
+    Both parsers raise json.JSONDecodeError on invalid input.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
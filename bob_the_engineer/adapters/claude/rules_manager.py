@@ -1,6 +1,6 @@
 """Claude Code rules manager adapter."""
 
-import json
+import functools
 import shutil
 from datetime import datetime
 from pathlib import Path
@@ -8,8 +8,38 @@ from typing import Any, cast
 
 from rich.console import Console
 
+from ..._json import dumps_json, loads_json
 from ..base import BaseAdapter
 
+_SETTINGS_TEMPLATES_DIR = Path(__file__).parent.parent.parent / "templates" / "settings"
+
+
+@functools.cache
+def _settings_template_files() -> tuple[Path, ...]:
+    """Find the bundled settings templates, sorted by file name."""
+    if not _SETTINGS_TEMPLATES_DIR.exists():
+        return ()
+    return tuple(sorted(_SETTINGS_TEMPLATES_DIR.glob("claude_*.json")))
+
+
+@functools.cache
+def _settings_templates_by_name() -> dict[str, Path]:
+    """Index the bundled settings templates by name, built once per process."""
+    return {
+        template_file.stem.replace("claude_", ""): template_file
+        for template_file in _settings_template_files()
+    }
+
+
+@functools.cache
+def _settings_template_source(template_file: Path) -> str:
+    """Read a bundled settings template once per process.
+
+    Only the source text is cached; callers parse it into a fresh dict, so
+    the templates they receive are safe to modify.
+    """
+    return template_file.read_text(encoding="utf-8")
+
 
 class ClaudeRulesManager(BaseAdapter):
     """Adapter for generating Claude Code rules configuration."""
@@ -139,8 +169,7 @@ class ClaudeRulesManager(BaseAdapter):
 
         # Load existing settings or create new ones
         if settings_file.exists():
-            with open(settings_file, encoding="utf-8") as f:
-                existing_settings = json.load(f)
+            existing_settings = loads_json(settings_file.read_bytes())
         else:
             existing_settings = {}
 
@@ -148,38 +177,33 @@ class ClaudeRulesManager(BaseAdapter):
         existing_settings.update(settings)
 
         # Write updated settings
-        with open(settings_file, "w", encoding="utf-8") as f:
-            json.dump(existing_settings, f, indent=2)
+        settings_file.write_text(dumps_json(existing_settings), encoding="utf-8")
 
         return settings_file
 
     @staticmethod
     def load_settings_template(template_name: str) -> dict[str, Any]:
         """Load a Claude Code settings template from the templates directory."""
-        template_file = (
-            Path(__file__).parent.parent.parent
-            / "templates"
-            / "settings"
-            / f"claude_{template_name}.json"
-        )
-
-        if not template_file.exists():
-            available = ClaudeRulesManager.list_available_templates()
-            available_names = [t.stem.replace("claude_", "") for t in available]
+        templates = _settings_templates_by_name()
+        try:
+            template_file = templates[template_name]
+        except KeyError as e:
             raise FileNotFoundError(
-                f"Template '{template_name}' not found. Available: {', '.join(available_names)}"
-            )
+                f"Template '{template_name}' not found. Available: {', '.join(templates)}"
+            ) from e
 
-        with template_file.open() as f:
-            return cast(dict[str, Any], json.load(f))
+        return cast(
+            dict[str, Any], loads_json(_settings_template_source(template_file))
+        )
 
     @staticmethod
-    def list_available_templates() -> list[Path]:
-        """List all available Claude Code settings templates."""
-        templates_dir = Path(__file__).parent.parent.parent / "templates" / "settings"
-        if not templates_dir.exists():
-            return []
-        return list(templates_dir.glob("claude_*.json"))
+    def list_available_templates() -> tuple[Path, ...]:
+        """List all available Claude Code settings templates.
+
+        The bundled templates are scanned once; every call returns the same
+        immutable tuple.
+        """
+        return _settings_template_files()
 
     def apply_settings_template(
         self, template: dict[str, Any], dry_run: bool = False
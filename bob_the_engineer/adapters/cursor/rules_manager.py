@@ -8,6 +8,36 @@ from typing import Any
 
 from ..base import BaseAdapter
 
+# Safety-focused AI commands installed into ai-commands.json. Shared,
+# never mutated: install_ai_commands only copies references out of it.
+_AI_COMMANDS: tuple[dict[str, str], ...] = (
+    {
+        "name": "safe-commit",
+        "prompt": "Stage and commit changes. NEVER use 'git add .' or 'git add -A'. Always add specific files by name. Show me what files you're adding before committing. Check .cursor/rules/bash_deny_list.mdc for safety guidelines.",
+        "description": "Safely commit changes with specific file additions",
+    },
+    {
+        "name": "install-deps",
+        "prompt": "Install project dependencies. First, show me what will be installed. Never use sudo. Prefer virtual environments for Python. Check .cursor/rules/bash_deny_list.mdc for safety guidelines.",
+        "description": "Safely install dependencies with review",
+    },
+    {
+        "name": "run-tests",
+        "prompt": "Run the test suite. If tests fail, analyze the errors and suggest fixes without making destructive changes. Never use rm -rf or force operations.",
+        "description": "Run tests and analyze results safely",
+    },
+    {
+        "name": "code-review",
+        "prompt": "Review the current changes for potential issues. Check for: accidental commits of sensitive files, unsafe commands, proper error handling. Reference .cursor/rules/bash_deny_list.mdc.",
+        "description": "Review code changes for safety and quality",
+    },
+    {
+        "name": "safe-cleanup",
+        "prompt": "Clean up temporary files and build artifacts. Never use 'rm -rf' without showing what will be deleted first. Use interactive mode when possible.",
+        "description": "Safely clean up project files",
+    },
+)
+
 
 class CursorRulesManager(BaseAdapter):
     """Adapter for generating Cursor rules configuration."""
@@ -397,33 +427,7 @@ This command will help you with {command_name.replace("-", " ")} operations.
             Path to the AI commands file
         """
         # Create ai-commands.json with safety-focused commands
-        ai_commands = [
-            {
-                "name": "safe-commit",
-                "prompt": "Stage and commit changes. NEVER use 'git add .' or 'git add -A'. Always add specific files by name. Show me what files you're adding before committing. Check .cursor/rules/bash_deny_list.mdc for safety guidelines.",
-                "description": "Safely commit changes with specific file additions",
-            },
-            {
-                "name": "install-deps",
-                "prompt": "Install project dependencies. First, show me what will be installed. Never use sudo. Prefer virtual environments for Python. Check .cursor/rules/bash_deny_list.mdc for safety guidelines.",
-                "description": "Safely install dependencies with review",
-            },
-            {
-                "name": "run-tests",
-                "prompt": "Run the test suite. If tests fail, analyze the errors and suggest fixes without making destructive changes. Never use rm -rf or force operations.",
-                "description": "Run tests and analyze results safely",
-            },
-            {
-                "name": "code-review",
-                "prompt": "Review the current changes for potential issues. Check for: accidental commits of sensitive files, unsafe commands, proper error handling. Reference .cursor/rules/bash_deny_list.mdc.",
-                "description": "Review code changes for safety and quality",
-            },
-            {
-                "name": "safe-cleanup",
-                "prompt": "Clean up temporary files and build artifacts. Never use 'rm -rf' without showing what will be deleted first. Use interactive mode when possible.",
-                "description": "Safely clean up project files",
-            },
-        ]
+        ai_commands = list(_AI_COMMANDS)
 
         commands_file = self.target_path / "ai-commands.json"
 
@@ -436,7 +440,7 @@ This command will help you with {command_name.replace("-", " ")} operations.
                     existing_names = {
                         cmd.get("name") for cmd in existing if isinstance(cmd, dict)
                     }
-                    for cmd in ai_commands:
+                    for cmd in _AI_COMMANDS:
                         if cmd["name"] not in existing_names:
                             existing.append(cmd)
                     ai_commands = existing
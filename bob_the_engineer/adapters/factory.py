@@ -36,13 +36,13 @@ class AdapterFactory:
         Raises:
             ValueError: If agent_type is not supported
         """
-        if agent_type not in self._adapters:
+        adapter_class = self._adapters.get(agent_type)
+        if adapter_class is None:
             supported = list(self._adapters.keys())
             raise ValueError(
                 f"Unsupported agent type: {agent_type}. Supported: {supported}"
             )
 
-        adapter_class = self._adapters[agent_type]
         return adapter_class(target_path, config)
 
     @classmethod
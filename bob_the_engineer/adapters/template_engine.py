@@ -1,6 +1,10 @@
 """Template engine for generating agent-specific rule configurations."""
 
+import copy
+import functools
 import logging
+import os
+from collections.abc import Callable, Iterator
 from pathlib import Path
 from typing import Any
 
@@ -9,6 +13,66 @@ from jinja2 import Environment, FileSystemLoader, select_autoescape
 
 from .factory import AdapterFactory
 
+# Agent types templates can be rendered for, resolved once at import
+_SUPPORTED_AGENT_TYPES: frozenset[str] = frozenset(
+    AdapterFactory.get_supported_agents()
+)
+
+# Repository-relative directory where each agent's command files go
+_COMMANDS_SUBDIRS: dict[str, str] = {
+    "claude-code": ".claude/commands",
+    "cursor": ".cursor/commands",
+}
+
+# File suffix of subagent and workflow templates
+_TEMPLATE_SUFFIX = ".jinja2.md"
+
+
+@functools.cache
+def _load_config_file(config_path: Path) -> dict[str, Any]:
+    """Parse an agent configuration file once per process.
+
+    Raises:
+        FileNotFoundError: If config file doesn't exist
+        yaml.YAMLError: If config file is invalid
+    """
+    if not config_path.exists():
+        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+
+    with open(config_path, encoding="utf-8") as f:
+        config = yaml.safe_load(f)
+        if not isinstance(config, dict):
+            raise ValueError(f"Invalid configuration format in {config_path}")
+        return config
+
+
+def _extract_frontmatter(content: str) -> str | None:
+    """Return the YAML frontmatter between leading ``---`` lines, if any."""
+    if not content.startswith("---\n"):
+        return None
+    end = content.find("\n---\n", 3)
+    if end == -1:
+        if not content.endswith("\n---"):
+            return None
+        end = len(content) - 4
+    return content[4:end]
+
+
+def _template_names(directory: Path) -> list[str]:
+    """List template names (without .jinja2.md extension) in a directory, sorted.
+
+    Returns an empty list if the directory does not exist.
+    """
+    try:
+        with os.scandir(directory) as it:
+            return sorted(
+                entry.name[: -len(_TEMPLATE_SUFFIX)]
+                for entry in it
+                if entry.name.endswith(_TEMPLATE_SUFFIX)
+            )
+    except FileNotFoundError:
+        return []
+
 
 class TemplateEngine:
     """Engine for rendering agent-specific rule templates."""
@@ -44,14 +108,8 @@ class TemplateEngine:
             self.templates_dir.parent / "adapters" / "config" / f"{agent_type}.yaml"
         )
 
-        if not config_path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {config_path}")
-
-        with open(config_path, encoding="utf-8") as f:
-            config = yaml.safe_load(f)
-            if not isinstance(config, dict):
-                raise ValueError(f"Invalid configuration format in {config_path}")
-            return config
+        # Hand out a copy so callers cannot modify the cached configuration
+        return copy.deepcopy(_load_config_file(config_path))
 
     def render_configure_rules(
         self,
@@ -96,19 +154,9 @@ class TemplateEngine:
         # Pass 2: Validate that frontmatter is valid YAML (optional)
         # This ensures the rendered frontmatter is proper YAML
         try:
-            lines = rendered_content.split("\n")
-            if lines[0] == "---":
-                # Find end of frontmatter
-                end_idx = None
-                for i, line in enumerate(lines[1:], 1):
-                    if line == "---":
-                        end_idx = i
-                        break
-
-                if end_idx:
-                    # Extract and validate frontmatter
-                    frontmatter_content = "\n".join(lines[1:end_idx])
-                    yaml.safe_load(frontmatter_content)  # Validate YAML
+            frontmatter_content = _extract_frontmatter(rendered_content)
+            if frontmatter_content is not None:
+                yaml.safe_load(frontmatter_content)  # Validate YAML
 
         except yaml.YAMLError as e:
             raise ValueError(
@@ -165,28 +213,20 @@ class TemplateEngine:
                 content = template.render(agent_type="cursor")
 
                 # Parse frontmatter to get metadata
-                lines = content.split("\n")
-                if lines[0] == "---":
-                    end_idx = None
-                    for i, line in enumerate(lines[1:], 1):
-                        if line == "---":
-                            end_idx = i
-                            break
-
-                    if end_idx:
-                        frontmatter_content = "\n".join(lines[1:end_idx])
-                        metadata = yaml.safe_load(frontmatter_content)
-
-                        workflow_name = template_file.stem.replace(".jinja2", "")
-                        workflows.append(
-                            {
-                                "name": workflow_name,
-                                "title": metadata.get("name", workflow_name),
-                                "description": metadata.get(
-                                    "description", "No description available"
-                                ),
-                            }
-                        )
+                frontmatter_content = _extract_frontmatter(content)
+                if frontmatter_content is not None:
+                    metadata = yaml.safe_load(frontmatter_content)
+
+                    workflow_name = template_file.stem.replace(".jinja2", "")
+                    workflows.append(
+                        {
+                            "name": workflow_name,
+                            "title": metadata.get("name", workflow_name),
+                            "description": metadata.get(
+                                "description", "No description available"
+                            ),
+                        }
+                    )
             except Exception as e:
                 # Skip templates that can't be parsed
                 # Log the error but continue processing other templates
@@ -206,17 +246,7 @@ class TemplateEngine:
         Returns:
             List of subagent template names (without .jinja2.md extension)
         """
-        subagents_dir = self.templates_dir / "subagents"
-        subagents: list[str] = []
-
-        if not subagents_dir.exists():
-            return subagents
-
-        for template_file in subagents_dir.glob("*.jinja2.md"):
-            subagent_name = template_file.stem.replace(".jinja2", "")
-            subagents.append(subagent_name)
-
-        return sorted(subagents)
+        return _template_names(self.templates_dir / "subagents")
 
     def list_available_workflows(self) -> list[str]:
         """List available workflow templates.
@@ -224,17 +254,7 @@ class TemplateEngine:
         Returns:
             List of workflow template names (without .jinja2.md extension)
         """
-        workflows_dir = self.templates_dir / "workflows" / "coding"
-        workflows: list[str] = []
-
-        if not workflows_dir.exists():
-            return workflows
-
-        for template_file in workflows_dir.glob("*.jinja2.md"):
-            workflow_name = template_file.stem.replace(".jinja2", "")
-            workflows.append(workflow_name)
-
-        return sorted(workflows)
+        return _template_names(self.templates_dir / "workflows" / "coding")
 
     def render_coding_workflow(
         self,
@@ -263,8 +283,7 @@ class TemplateEngine:
             raise ValueError(f"Workflow template '{workflow_name}' not found") from e
 
         # Validate agent type
-        supported_agents = ["claude-code", "cursor"]
-        if agent_type not in supported_agents:
+        if agent_type not in _SUPPORTED_AGENT_TYPES:
             raise ValueError(f"Unsupported agent type: {agent_type}")
 
         # Create template context
@@ -298,28 +317,45 @@ class TemplateEngine:
         """
         output_paths = []
 
-        # Determine target directory based on agent type
-        if agent_type == "claude-code":
-            commands_dir = target_path / ".claude" / "commands"
-        elif agent_type == "cursor":
-            commands_dir = target_path / ".cursor" / "commands"
-        else:
-            raise ValueError(f"Unsupported agent type: {agent_type}")
+        for _, result in self.generate_workflows(
+            workflow_names, agent_type, target_path, additional_context
+        ):
+            if isinstance(result, Exception):
+                raise result
+            output_paths.append(result)
 
-        # Create directory if it doesn't exist
-        commands_dir.mkdir(parents=True, exist_ok=True)
+        return output_paths
 
-        # Install each workflow
-        for workflow_name in workflow_names:
-            rendered_content = self.render_coding_workflow(
-                workflow_name, agent_type, additional_context
-            )
+    def generate_workflows(
+        self,
+        workflow_names: list[str],
+        agent_type: str,
+        target_path: Path,
+        additional_context: dict[str, Any] | None = None,
+    ) -> Iterator[tuple[str, Path | Exception]]:
+        """Render and write several workflows, creating the output directory once.
 
-            output_file = commands_dir / f"{workflow_name}.md"
-            output_file.write_text(rendered_content, encoding="utf-8")
-            output_paths.append(output_file)
+        Args:
+            workflow_names: List of workflow names to install
+            agent_type: Type of coding agent
+            target_path: Path to target repository
+            additional_context: Optional additional template context
 
-        return output_paths
+        Yields:
+            (workflow_name, output path) for each installed workflow, or
+            (workflow_name, error) if that workflow failed to install
+
+        Raises:
+            ValueError: If agent type is unsupported
+        """
+        return self._install_commands(
+            workflow_names,
+            agent_type,
+            target_path,
+            lambda name: self.render_coding_workflow(
+                name, agent_type, additional_context
+            ),
+        )
 
     def render_subagent_template(
         self,
@@ -343,8 +379,7 @@ class TemplateEngine:
             ValueError: If agent type or subagent is not supported
         """
         # Validate agent type
-        supported_agents = ["claude-code", "cursor"]
-        if agent_type not in supported_agents:
+        if agent_type not in _SUPPORTED_AGENT_TYPES:
             raise ValueError(f"Unsupported agent type: {agent_type}")
 
         # Check if template exists
@@ -368,19 +403,9 @@ class TemplateEngine:
         # Pass 2: Validate that frontmatter is valid YAML (optional)
         # This ensures the rendered frontmatter is proper YAML
         try:
-            lines = rendered_content.split("\n")
-            if lines[0] == "---":
-                # Find end of frontmatter
-                end_idx = None
-                for i, line in enumerate(lines[1:], 1):
-                    if line == "---":
-                        end_idx = i
-                        break
-
-                if end_idx:
-                    # Extract and validate frontmatter
-                    frontmatter_content = "\n".join(lines[1:end_idx])
-                    yaml.safe_load(frontmatter_content)  # Validate YAML
+            frontmatter_content = _extract_frontmatter(rendered_content)
+            if frontmatter_content is not None:
+                yaml.safe_load(frontmatter_content)  # Validate YAML
 
         except yaml.YAMLError as e:
             raise ValueError(
@@ -407,26 +432,91 @@ class TemplateEngine:
         Returns:
             List of output file paths where rules were written
         """
-        # Render template
-        rendered_content = self.render_subagent_template(
-            subagent_name, agent_type, target_path, additional_context
+        output_paths = []
+
+        # Subagents are installed as command files for both agents
+        for _, result in self.generate_subagents(
+            [subagent_name], agent_type, target_path, additional_context
+        ):
+            if isinstance(result, Exception):
+                raise result
+            output_paths.append(result)
+
+        return output_paths
+
+    def generate_subagents(
+        self,
+        subagent_names: list[str],
+        agent_type: str,
+        target_path: Path,
+        additional_context: dict[str, Any] | None = None,
+    ) -> Iterator[tuple[str, Path | Exception]]:
+        """Render and write several subagents, creating the output directory once.
+
+        Args:
+            subagent_names: Names of the subagent templates
+            agent_type: Type of coding agent
+            target_path: Path to target repository
+            additional_context: Optional additional template context
+
+        Yields:
+            (subagent_name, output path) for each installed subagent, or
+            (subagent_name, error) if that subagent failed to install
+
+        Raises:
+            ValueError: If agent type is unsupported
+        """
+        return self._install_commands(
+            subagent_names,
+            agent_type,
+            target_path,
+            lambda name: self.render_subagent_template(
+                name, agent_type, target_path, additional_context
+            ),
         )
 
-        # Determine output path based on agent type
-        if agent_type == "claude-code":
-            # For Claude Code, create a command file
-            commands_dir = target_path / ".claude" / "commands"
-            commands_dir.mkdir(parents=True, exist_ok=True)
-            output_file = commands_dir / f"{subagent_name}.md"
-        elif agent_type == "cursor":
-            # For Cursor, create a command file
-            commands_dir = target_path / ".cursor" / "commands"
-            commands_dir.mkdir(parents=True, exist_ok=True)
-            output_file = commands_dir / f"{subagent_name}.md"
-        else:
-            raise ValueError(f"Unsupported agent type: {agent_type}")
+    def _install_commands(
+        self,
+        names: list[str],
+        agent_type: str,
+        target_path: Path,
+        render: Callable[[str], str],
+    ) -> Iterator[tuple[str, Path | Exception]]:
+        """Render and write command files, creating the output directory once.
 
-        # Write the rendered content
-        output_file.write_text(rendered_content, encoding="utf-8")
+        Args:
+            names: Template names to install
+            agent_type: Type of coding agent
+            target_path: Path to target repository
+            render: Callable returning the rendered content for a name
 
-        return [output_file]
+        Yields:
+            (name, output path) for each installed file, or (name, error)
+            if that file failed to install
+
+        Raises:
+            ValueError: If agent type is unsupported
+        """
+        commands_dir = self._commands_dir(agent_type, target_path)
+        commands_dir.mkdir(parents=True, exist_ok=True)
+
+        for name in names:
+            try:
+                output_file = commands_dir / f"{name}.md"
+                output_file.write_text(render(name), encoding="utf-8")
+            except Exception as e:
+                yield name, e
+            else:
+                yield name, output_file
+
+    @staticmethod
+    def _commands_dir(agent_type: str, target_path: Path) -> Path:
+        """Return the directory where an agent's command files are installed.
+
+        Raises:
+            ValueError: If agent type is unsupported
+        """
+        try:
+            return target_path / _COMMANDS_SUBDIRS[agent_type]
+        except KeyError:
+            raise ValueError(f"Unsupported agent type: {agent_type}") from None
@@ -1,22 +1,33 @@
 """Main CLI application for bob-the-engineer."""
 
+import functools
 import json
-from datetime import datetime
+import os
+import re
+import sys
+import time
+from collections.abc import Callable
+from importlib.resources import files
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, NoReturn
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
+from rich.console import Console, Group, RenderableType
 from rich.table import Table
+from rich.text import Text
 
 from bob_the_engineer import __version__
+from bob_the_engineer._json import dumps_json, loads_json
 from bob_the_engineer.adapters.claude.rules_manager import ClaudeRulesManager
 from bob_the_engineer.adapters.cursor.rules_manager import CursorRulesManager
 from bob_the_engineer.adapters.factory import AdapterFactory
-from bob_the_engineer.adapters.template_engine import TemplateEngine
 from bob_the_engineer.cli.logging_config import get_logger, setup_cli_logging
 
+if TYPE_CHECKING:
+    import structlog
+
+    from bob_the_engineer.adapters.template_engine import TemplateEngine
+
 # Create the main Typer app
 app = typer.Typer(
     name="bob-the-engineer",
@@ -25,6 +36,98 @@ app = typer.Typer(
 )
 
 console = Console()
+# For literal text (paths, names, config content): no markup or highlighting
+plain_console = Console(highlight=False, markup=False)
+
+# Markup prefixes shared by status and error messages
+_ERR = "[red]Error:[/red]"
+_OK = "[green]✓[/green]"
+_FAIL = "[red]✗[/red]"
+
+# Markup tags stripped by _cprint when stdout is not a terminal
+_MARKUP_TAG_RE = re.compile(r"\[/?[a-z ]+\]")
+
+# Supported agent types, resolved once from the adapter registry. The tuple
+# keeps registry order for messages; the frozenset is used for membership.
+_SUPPORTED_AGENT_NAMES: tuple[str, ...] = tuple(AdapterFactory.get_supported_agents())
+_SUPPORTED_AGENTS: frozenset[str] = frozenset(_SUPPORTED_AGENT_NAMES)
+
+# Workflows accepted by configure-workflows
+_WORKFLOW_NAMES: tuple[str, ...] = (
+    "spec-driven",
+    "tdd",
+    "code-review",
+    "research",
+    "triage",
+)
+_AVAILABLE_WORKFLOWS: frozenset[str] = frozenset(_WORKFLOW_NAMES)
+
+# Comma separator (with surrounding whitespace) for comma-separated options
+_LIST_SEPARATOR_RE = re.compile(r"\s*,\s*")
+
+# Configuration templates accepted by configure-defaults
+_AVAILABLE_TEMPLATES: tuple[str, ...] = ("vibe_coder", "software_engineer")
+
+# Protections installed for Cursor by the software_engineer template
+_CURSOR_SECURITY_FEATURES: tuple[str, ...] = (
+    "AI safety guidelines (.cursor/rules/bash_deny_list.mdc)",
+    "Shell command protection (bash_protection.sh)",
+    "Safe AI commands (ai-commands.json)",
+)
+
+
+def _write_file_fast(path: Path, content: str) -> None:
+    """Write content to path as UTF-8 with raw os-level writes (no buffering)."""
+    data = memoryview(content.encode("utf-8"))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        while data:
+            data = data[os.write(fd, data) :]
+    finally:
+        os.close(fd)
+
+
+def _cprint(message: str) -> None:
+    """Print a markup string, stripping the markup when stdout is not a TTY.
+
+    Plain text is written straight to stdout when it is piped (CI logs,
+    `| tee`); otherwise the message goes to the Rich console.
+    """
+    stream = sys.stdout
+    if stream is not None and not stream.isatty():
+        stream.write(_MARKUP_TAG_RE.sub("", message) + "\n")
+    else:
+        console.print(message)
+
+
+def _fail(
+    logger: "structlog.BoundLogger", message: str, exc: Exception, event: str
+) -> NoReturn:
+    """Report a failed command and exit with status 1.
+
+    A typer.Exit raised by the command's own validation is re-raised
+    unchanged, since its message has already been printed.
+
+    Args:
+        logger: Logger of the failing command
+        message: Markup message to print
+        exc: Exception that caused the failure
+        event: Log event name for the failure
+    """
+    if isinstance(exc, typer.Exit):
+        raise exc
+    _cprint(message)
+    logger.error(event, error=str(exc))
+    raise typer.Exit(1) from exc
+
+
+def _add_plain_row(table: Table, *cells: str) -> None:
+    """Add a row of literal text cells, skipping Rich markup parsing.
+
+    Cells take their style from the column, and values such as file paths
+    containing square brackets are shown verbatim.
+    """
+    table.add_row(*(Text(cell) for cell in cells))
 
 
 @app.callback()
@@ -84,8 +187,14 @@ def status() -> None:
 
     logger.info("Status command invoked")
 
-    # Check if we're in a git repository
-    git_dir = Path(".git")
+    # List the working directory once; names missing from the listing fall
+    # back to os.path.exists, which honours case-insensitive filesystems and
+    # still works when the directory cannot be listed
+    try:
+        with os.scandir(".") as it:
+            entries = {entry.name for entry in it}
+    except OSError:
+        entries = set()
 
     table = Table(title="Project Status")
     table.add_column("Check", style="cyan")
@@ -93,11 +202,13 @@ def status() -> None:
     table.add_column("Details", style="dim")
 
     # Git repository check
-    if git_dir.exists():
-        table.add_row("Git Repository", "✓ Found", str(git_dir.absolute()))
+    if ".git" in entries or os.path.exists(".git"):
+        _add_plain_row(table, "Git Repository", "✓ Found", os.path.abspath(".git"))
         logger.info("Git repository detected")
     else:
-        table.add_row("Git Repository", "✗ Not found", "Not in a git repository")
+        _add_plain_row(
+            table, "Git Repository", "✗ Not found", "Not in a git repository"
+        )
         logger.warning("No git repository found")
 
     # Configuration files check
@@ -109,12 +220,11 @@ def status() -> None:
     ]
 
     for filename, description in config_files:
-        filepath = Path(filename)
-        if filepath.exists():
-            table.add_row(description, "✓ Found", str(filepath.absolute()))
+        if filename in entries or os.path.exists(filename):
+            _add_plain_row(table, description, "✓ Found", os.path.abspath(filename))
             logger.info("Configuration file found", file=filename)
         else:
-            table.add_row(description, "✗ Not found", f"No {filename}")
+            _add_plain_row(table, description, "✗ Not found", f"No {filename}")
             logger.warning("Configuration file missing", file=filename)
 
     console.print(table)
@@ -183,62 +293,69 @@ def configure_defaults(
 
         # Validate required parameters
         if not agent_type:
-            console.print("[red]Error:[/red] --agent-type is required")
-            console.print("[dim]Supported types: claude-code, cursor[/dim]")
+            console.print(f"{_ERR} --agent-type is required")
+            console.print(
+                f"[dim]Supported types: {', '.join(_SUPPORTED_AGENT_NAMES)}[/dim]"
+            )
             raise typer.Exit(1)
 
         if not template_type:
-            console.print("[red]Error:[/red] --template-type is required")
+            console.print(f"{_ERR} --template-type is required")
             console.print(
-                "[dim]Available templates: vibe_coder, software_engineer[/dim]"
+                f"[dim]Available templates: {', '.join(_AVAILABLE_TEMPLATES)}[/dim]"
             )
             console.print("[dim]Use --list to see detailed descriptions[/dim]")
             raise typer.Exit(1)
 
         # Validate agent type
-        supported_agents = ["claude-code", "cursor"]
-        if agent_type not in supported_agents:
-            console.print(f"[red]Error:[/red] Unsupported agent type: {agent_type}")
-            console.print(f"[dim]Supported types: {', '.join(supported_agents)}[/dim]")
+        if agent_type not in _SUPPORTED_AGENTS:
+            console.print(f"{_ERR} Unsupported agent type: {agent_type}")
+            console.print(
+                f"[dim]Supported types: {', '.join(_SUPPORTED_AGENT_NAMES)}[/dim]"
+            )
             raise typer.Exit(1)
 
         # Validate template type
-        available_templates = ["vibe_coder", "software_engineer"]
-        if template_type not in available_templates:
+        if template_type not in _AVAILABLE_TEMPLATES:
+            console.print(f"{_ERR} Unsupported template type: {template_type}")
             console.print(
-                f"[red]Error:[/red] Unsupported template type: {template_type}"
-            )
-            console.print(
-                f"[dim]Available templates: {', '.join(available_templates)}[/dim]"
+                f"[dim]Available templates: {', '.join(_AVAILABLE_TEMPLATES)}[/dim]"
             )
             raise typer.Exit(1)
 
         # Validate repository path
-        repo_path_obj = Path(repo_path).resolve()
-        if not repo_path_obj.exists():
-            console.print(
-                f"[red]Error:[/red] Repository path does not exist: {repo_path}"
-            )
+        if not os.path.exists(repo_path):
+            console.print(f"{_ERR} Repository path does not exist: {repo_path}")
             raise typer.Exit(1)
+        repo_path_obj = Path(os.path.abspath(repo_path))
 
         console.print(
             f"[cyan]Configuring {agent_type} with {template_type} template...[/cyan]"
         )
 
         # Apply configuration based on agent type
-        if agent_type == "claude-code":
-            _configure_claude_code(repo_path_obj, template_type, dry_run)
-        elif agent_type == "cursor":
-            _configure_cursor(repo_path_obj, template_type, dry_run)
+        _DEFAULTS_CONFIGURERS[agent_type](repo_path_obj, template_type, dry_run)
 
         logger.info("Configure defaults command completed successfully")
 
     except Exception as e:
-        console.print(f"[red]Unexpected error:[/red] {e}")
-        logger.error(
-            "Configure defaults command failed with unexpected error", error=str(e)
+        _fail(
+            logger,
+            f"[red]Unexpected error:[/red] {e}",
+            e,
+            "Configure defaults command failed with unexpected error",
         )
-        raise typer.Exit(1) from e
+
+
+@functools.cache
+def _template_summary(template_name: str) -> tuple[str, str]:
+    """Return a template's (description, best_for), loading it once per process."""
+    template_data = ClaudeRulesManager.load_settings_template(template_name)
+    info = template_data.get("_template_info", {})
+    return (
+        info.get("description", "No description"),
+        info.get("best_for", "General use"),
+    )
 
 
 def _display_available_templates() -> None:
@@ -249,8 +366,6 @@ def _display_available_templates() -> None:
         console.print("[yellow]No configuration templates found.[/yellow]")
         return
 
-    console.print("\n[bold cyan]Available Configuration Templates[/bold cyan]")
-
     table = Table()
     table.add_column("Template", style="cyan")
     table.add_column("Description", style="white")
@@ -259,22 +374,19 @@ def _display_available_templates() -> None:
     for template_file in templates:
         template_name = template_file.stem.replace("claude_", "")
         try:
-            template_data = ClaudeRulesManager.load_settings_template(template_name)
-            info = template_data.get("_template_info", {})
-
-            table.add_row(
-                template_name,
-                info.get("description", "No description"),
-                info.get("best_for", "General use"),
-            )
+            table.add_row(template_name, *_template_summary(template_name))
         except Exception as e:
             table.add_row(
                 template_name, f"[red]Error loading template: {e}[/red]", "N/A"
             )
 
-    console.print(table)
+    # Heading, table and usage hint
     console.print(
-        "\n[dim]Use --agent-type and --template-type to apply a template.[/dim]"
+        Group(
+            "\n[bold cyan]Available Configuration Templates[/bold cyan]",
+            table,
+            "\n[dim]Use --agent-type and --template-type to apply a template.[/dim]",
+        )
     )
 
 
@@ -356,11 +468,8 @@ def _configure_cursor(repo_path: Path, template_name: str, dry_run: bool) -> Non
                     f"[dim]Description: {template_info.get('description', 'N/A')}[/dim]"
                 )
                 console.print("\n[yellow]Would install security protections:[/yellow]")
-                console.print(
-                    "  • AI safety guidelines (.cursor/rules/bash_deny_list.mdc)"
-                )
-                console.print("  • Shell command protection (bash_protection.sh)")
-                console.print("  • Safe AI commands (ai-commands.json)")
+                for feature in _CURSOR_SECURITY_FEATURES:
+                    plain_console.print(f"  • {feature}")
             else:
                 # Apply security protections using existing rules manager
                 console.print(
@@ -376,11 +485,11 @@ def _configure_cursor(repo_path: Path, template_name: str, dry_run: bool) -> Non
                     "\n[bold cyan]Security Configuration Applied:[/bold cyan]"
                 )
                 if results.get("ai_rules"):
-                    console.print("  ✅ AI safety guidelines installed")
+                    plain_console.print("  ✅ AI safety guidelines installed")
                 if results.get("ai_commands"):
-                    console.print("  ✅ Safe AI commands configured")
+                    plain_console.print("  ✅ Safe AI commands configured")
                 if results.get("shell_protection", {}).get("protection_installed"):
-                    console.print("  ✅ Shell protection enabled")
+                    plain_console.print("  ✅ Shell protection enabled")
 
         if not dry_run:
             console.print("[green]✓ Cursor configuration completed![/green]")
@@ -390,26 +499,35 @@ def _configure_cursor(repo_path: Path, template_name: str, dry_run: bool) -> Non
         raise
 
 
+# configure-defaults implementation per agent type
+_DEFAULTS_CONFIGURERS: dict[str, Callable[[Path, str, bool], None]] = {
+    "claude-code": _configure_claude_code,
+    "cursor": _configure_cursor,
+}
+
+
 def _display_analysis_results(analysis: Any) -> None:
     """Display repository analysis results."""
-    console.print("\n[bold cyan]Repository Analysis Results[/bold cyan]")
-    console.print("=" * 40)
+    lines: list[RenderableType] = [
+        "\n[bold cyan]Repository Analysis Results[/bold cyan]",
+        "=" * 40,
+    ]
 
     # Tech stack
     if hasattr(analysis, "tech_stack") and analysis.tech_stack:
         tech_list = ", ".join(analysis.tech_stack)
-        console.print(f"[bold]Tech Stack:[/bold] {tech_list}")
+        lines.append(f"[bold]Tech Stack:[/bold] {tech_list}")
 
     # Team size
     if hasattr(analysis, "team_size"):
-        console.print(f"[bold]Estimated Team Size:[/bold] {analysis.team_size}")
+        lines.append(f"[bold]Estimated Team Size:[/bold] {analysis.team_size}")
 
     # Repository characteristics
     if hasattr(analysis, "repo_size"):
-        console.print(f"[bold]Repository Size:[/bold] ~{analysis.repo_size} files")
+        lines.append(f"[bold]Repository Size:[/bold] ~{analysis.repo_size} files")
 
     if hasattr(analysis, "security_level"):
-        console.print(f"[bold]Security Level:[/bold] {analysis.security_level}")
+        lines.append(f"[bold]Security Level:[/bold] {analysis.security_level}")
 
     # Features detected
     features = []
@@ -421,65 +539,67 @@ def _display_analysis_results(analysis: Any) -> None:
         features.append("Microservices")
 
     if features:
-        console.print(f"[bold]Features Detected:[/bold] {', '.join(features)}")
+        lines.append(f"[bold]Features Detected:[/bold] {', '.join(features)}")
 
     # Display package managers and frameworks
     if analysis.package_managers:
-        console.print(
+        lines.append(
             f"\n[bold]Package Managers:[/bold] {', '.join(analysis.package_managers)}"
         )
     if analysis.frameworks:
-        console.print(f"[bold]Frameworks:[/bold] {', '.join(analysis.frameworks)}")
+        lines.append(f"[bold]Frameworks:[/bold] {', '.join(analysis.frameworks)}")
+
+    console.print(Group(*lines))
 
 
 def _display_config_preview(
     template: Any, agent_type: str, config_content: str, analysis: Any
 ) -> None:
     """Display configuration preview without applying changes."""
-    console.print(
-        f"\n[bold yellow]Configuration Preview - {template.name}[/bold yellow]"
-    )
-    console.print("=" * 60)
-
-    # Show template info
-    console.print(f"[bold]Template:[/bold] {template.name}")
-    console.print(f"[bold]Agent Type:[/bold] {agent_type}")
-    console.print(f"[bold]Description:[/bold] {template.description}")
+    lines: list[RenderableType] = [
+        f"\n[bold yellow]Configuration Preview - {template.name}[/bold yellow]",
+        "=" * 60,
+        # Show template info
+        f"[bold]Template:[/bold] {template.name}",
+        f"[bold]Agent Type:[/bold] {agent_type}",
+        f"[bold]Description:[/bold] {template.description}",
+    ]
 
     if agent_type == "claude-code":
         files_to_modify = [".claude-code-config.json"]
     else:
         files_to_modify = [".cursorrules"]
 
-    console.print("\n[bold]Files to be created/modified:[/bold]")
-    for file in files_to_modify:
-        console.print(f"  • {file}")
+    lines.append("\n[bold]Files to be created/modified:[/bold]")
+    lines.extend(f"  • {file}" for file in files_to_modify)
 
-    console.print("\n[bold]Configuration Content Preview:[/bold]")
+    lines.append("\n[bold]Configuration Content Preview:[/bold]")
 
     # Show first few lines of config
-    lines = config_content.split("\n")
-    preview_lines = lines[:15] if len(lines) > 15 else lines
+    config_lines = config_content.split("\n")
+    preview_lines = config_lines[:15] if len(config_lines) > 15 else config_lines
 
-    for line in preview_lines:
-        console.print(f"  {line}")
+    lines.extend(Text(f"  {line}") for line in preview_lines)
 
-    if len(lines) > 15:
-        console.print(f"  ... ({len(lines) - 15} more lines)")
+    if len(config_lines) > 15:
+        lines.append(f"  ... ({len(config_lines) - 15} more lines)")
 
     # Show recommendation confidence
-    console.print(
+    lines.append(
         f"\n[dim]Template recommendation confidence: {analysis.confidence:.1%}[/dim]"
     )
-    console.print(
+    lines.append(
         "\n[yellow]This is a preview. Use --no-dry-run to apply the configuration.[/yellow]"
     )
 
+    console.print(Group(*lines))
+
 
 def _apply_configuration(
     template: Any, agent_type: str, config_content: str, repo_path: Path, analysis: Any
 ) -> None:
     """Apply the configuration to the repository."""
+
     console.print(
         f"\n[bold green]Applying {template.name} configuration...[/bold green]"
     )
@@ -488,19 +608,19 @@ def _apply_configuration(
         if agent_type == "claude-code":
             config_file = repo_path / ".claude-code-config.json"
             config_file.write_text(config_content)
-            console.print(f"[green]✓[/green] Created {config_file}")
+            console.print(f"{_OK} Created {config_file}")
 
         elif agent_type == "cursor":
             config_file = repo_path / ".cursorrules"
             config_file.write_text(config_content)
-            console.print(f"[green]✓[/green] Created {config_file}")
+            console.print(f"{_OK} Created {config_file}")
 
         # Generate documentation
         doc_content = f"""# Coding Agent Configuration Applied
 
 **Template:** {template.name}
 **Agent Type:** {agent_type}
-**Applied:** {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+**Applied:** {time.strftime("%Y-%m-%d %H:%M:%S")}
 
 ## Template Description
 {template.description}
@@ -525,7 +645,7 @@ Generated by bob-the-engineer configure-defaults
 """
         doc_file = repo_path / f"AGENT_CONFIG_{agent_type.upper()}.md"
         doc_file.write_text(doc_content)
-        console.print(f"[green]✓[/green] Created documentation: {doc_file}")
+        console.print(f"{_OK} Created documentation: {doc_file}")
 
         console.print("\n[bold green]Configuration successfully applied![/bold green]")
         console.print(
@@ -575,38 +695,30 @@ def configure_workflows(
 
     try:
         # Validate agent type
-        supported_agents = ["claude-code", "cursor"]
-        if agent_type not in supported_agents:
-            console.print(f"[red]Error:[/red] Unsupported agent type: {agent_type}")
-            console.print(f"[dim]Supported types: {', '.join(supported_agents)}[/dim]")
+        if agent_type not in _SUPPORTED_AGENTS:
+            console.print(f"{_ERR} Unsupported agent type: {agent_type}")
+            console.print(
+                f"[dim]Supported types: {', '.join(_SUPPORTED_AGENT_NAMES)}[/dim]"
+            )
             raise typer.Exit(1)
 
         # Validate repository path
-        repo_path_obj = Path(repo_path).resolve()
-        if not repo_path_obj.exists():
-            console.print(
-                f"[red]Error:[/red] Repository path does not exist: {repo_path}"
-            )
+        if not os.path.exists(repo_path):
+            console.print(f"{_ERR} Repository path does not exist: {repo_path}")
             raise typer.Exit(1)
+        repo_path_obj = Path(os.path.abspath(repo_path))
 
         # Parse workflows
-        workflow_list = [w.strip() for w in workflows.split(",")]
-        available_workflows = [
-            "spec-driven",
-            "tdd",
-            "code-review",
-            "research",
-            "triage",
-        ]
+        workflow_list = _LIST_SEPARATOR_RE.split(workflows.strip())
 
         # Validate workflows
-        invalid_workflows = [w for w in workflow_list if w not in available_workflows]
+        invalid_workflows = set(workflow_list) - _AVAILABLE_WORKFLOWS
         if invalid_workflows:
             console.print(
-                f"[red]Error:[/red] Invalid workflows: {', '.join(invalid_workflows)}"
+                f"{_ERR} Invalid workflows: {', '.join(sorted(invalid_workflows))}"
             )
             console.print(
-                f"[dim]Available workflows: {', '.join(available_workflows)}[/dim]"
+                f"[dim]Available workflows: {', '.join(_WORKFLOW_NAMES)}[/dim]"
             )
             raise typer.Exit(1)
 
@@ -616,23 +728,20 @@ def configure_workflows(
         adapter = AdapterFactory.create_adapter(agent_type, target_path=repo_path_obj)
 
         if dry_run:
-            console.print(
-                "[yellow]Dry-run mode: Preview of workflow configuration[/yellow]"
-            )
-            console.print(f"[dim]Target agent: {agent_type}[/dim]")
-            console.print(f"[dim]Repository: {repo_path_obj}[/dim]")
-            console.print(
-                f"[dim]Workflows to configure: {', '.join(workflow_list)}[/dim]"
+            commands_dir = (
+                ".claude/commands"
+                if agent_type == "claude-code"
+                else ".cursor/commands"
             )
-
-            if agent_type == "claude-code":
-                console.print("[dim]Would create commands in .claude/commands/[/dim]")
-                for workflow in workflow_list:
-                    console.print(f"  • {workflow}.md")
-            else:
-                console.print("[dim]Would create commands in .cursor/commands/[/dim]")
-                for workflow in workflow_list:
-                    console.print(f"  • {workflow}.md")
+            lines = [
+                "[yellow]Dry-run mode: Preview of workflow configuration[/yellow]",
+                f"[dim]Target agent: {agent_type}[/dim]",
+                f"[dim]Repository: {repo_path_obj}[/dim]",
+                f"[dim]Workflows to configure: {', '.join(workflow_list)}[/dim]",
+                f"[dim]Would create commands in {commands_dir}/[/dim]",
+            ]
+            lines.extend(f"  • {workflow}.md" for workflow in workflow_list)
+            console.print("\n".join(lines))
 
         else:
             # Configure workflows (need to implement this in adapter)
@@ -641,10 +750,10 @@ def configure_workflows(
                 console.print("[green]Workflows configured successfully![/green]")
                 console.print("[dim]Configured files:[/dim]")
                 for path in output_paths:
-                    console.print(f"  • {path}")
+                    plain_console.print(f"  • {path}")
             except AttributeError as e:
                 console.print(
-                    f"[red]Error:[/red] Workflow configuration not yet implemented for {agent_type}"
+                    f"{_ERR} Workflow configuration not yet implemented for {agent_type}"
                 )
                 console.print(
                     "[yellow]Please use the configure-defaults command for now[/yellow]"
@@ -654,15 +763,14 @@ def configure_workflows(
         logger.info("Configure workflows command completed successfully")
 
     except ValueError as e:
-        console.print(f"[red]Error:[/red] {e}")
-        logger.error("Configure workflows command failed", error=str(e))
-        raise typer.Exit(1) from e
+        _fail(logger, f"{_ERR} {e}", e, "Configure workflows command failed")
     except Exception as e:
-        console.print(f"[red]Unexpected error:[/red] {e}")
-        logger.error(
-            "Configure workflows command failed with unexpected error", error=str(e)
+        _fail(
+            logger,
+            f"[red]Unexpected error:[/red] {e}",
+            e,
+            "Configure workflows command failed with unexpected error",
         )
-        raise typer.Exit(1) from e
 
 
 @app.command()
@@ -704,25 +812,24 @@ def configure_mcp(
 
     try:
         # Validate agent type
-        supported_agents = ["claude-code", "cursor"]
-        if agent_type not in supported_agents:
-            console.print(f"[red]Error:[/red] Unsupported agent type: {agent_type}")
-            console.print(f"[dim]Supported types: {', '.join(supported_agents)}[/dim]")
+        if agent_type not in _SUPPORTED_AGENTS:
+            console.print(f"{_ERR} Unsupported agent type: {agent_type}")
+            console.print(
+                f"[dim]Supported types: {', '.join(_SUPPORTED_AGENT_NAMES)}[/dim]"
+            )
             raise typer.Exit(1)
 
         # Validate repository path
-        repo_path_obj = Path(repo_path).resolve()
-        if not repo_path_obj.exists():
-            console.print(
-                f"[red]Error:[/red] Repository path does not exist: {repo_path}"
-            )
+        if not os.path.exists(repo_path):
+            console.print(f"{_ERR} Repository path does not exist: {repo_path}")
             raise typer.Exit(1)
+        repo_path_obj = Path(os.path.abspath(repo_path))
 
         # Parse and validate JSON configuration
         try:
-            mcp_config = json.loads(config)
+            mcp_config = loads_json(config)
         except json.JSONDecodeError as e:
-            console.print(f"[red]Error:[/red] Invalid JSON configuration: {e}")
+            console.print(f"{_ERR} Invalid JSON configuration: {e}")
             console.print(
                 "[dim]Note: Use proper JSON syntax, not {...} placeholders[/dim]"
             )
@@ -751,8 +858,10 @@ def configure_mcp(
             console.print(f"[dim]Repository: {repo_path_obj}[/dim]")
             console.print(f"[dim]Configuration file: {config_description}[/dim]")
 
+            from rich.panel import Panel  # noqa: PLC0415 - deferred for startup time
+
             console.print("\n[bold]Configuration to apply:[/bold]")
-            formatted_config = json.dumps(mcp_config, indent=2)
+            formatted_config = dumps_json(mcp_config)
             console.print(
                 Panel(
                     formatted_config,
@@ -771,10 +880,9 @@ def configure_mcp(
                 settings_file = repo_path_obj / ".claude" / "settings.json"
 
                 # Load existing settings
-                if settings_file.exists():
-                    with open(settings_file) as f:
-                        existing_settings = json.load(f)
-                else:
+                try:
+                    existing_settings = loads_json(settings_file.read_bytes())
+                except FileNotFoundError:
                     existing_settings = {}
                     # Ensure directory exists
                     settings_file.parent.mkdir(parents=True, exist_ok=True)
@@ -783,8 +891,9 @@ def configure_mcp(
                 existing_settings.update(mcp_config)
 
                 # Write updated settings
-                with open(settings_file, "w") as f:
-                    json.dump(existing_settings, f, indent=2)
+                settings_file.write_text(
+                    dumps_json(existing_settings), encoding="utf-8"
+                )
 
             else:  # cursor
                 # Write MCP config to dedicated file
@@ -792,32 +901,148 @@ def configure_mcp(
                 cursor_dir.mkdir(parents=True, exist_ok=True)
                 mcp_file = cursor_dir / "mcp.json"
 
-                with open(mcp_file, "w") as f:
-                    json.dump(mcp_config, f, indent=2)
+                _write_file_fast(mcp_file, dumps_json(mcp_config))
 
-            console.print("✓ MCP configuration applied successfully!")
+            plain_console.print("✓ MCP configuration applied successfully!")
 
             # Show what was configured
             console.print("\n[bold cyan]Configuration Applied:[/bold cyan]")
             if "mcpServers" in mcp_config:
                 servers = list(mcp_config["mcpServers"].keys())
-                console.print(f"  • Configured MCP servers: {', '.join(servers)}")
+                plain_console.print(f"  • Configured MCP servers: {', '.join(servers)}")
             elif "servers" in mcp_config:
                 servers = list(mcp_config["servers"].keys())
-                console.print(f"  • Configured MCP servers: {', '.join(servers)}")
+                plain_console.print(f"  • Configured MCP servers: {', '.join(servers)}")
             else:
-                console.print("  • Custom MCP configuration applied")
+                plain_console.print("  • Custom MCP configuration applied")
 
         logger.info("Configure MCP command completed successfully")
 
     except ValueError as e:
-        console.print(f"[red]Error:[/red] {e}")
-        logger.error("Configure MCP command failed", error=str(e))
-        raise typer.Exit(1) from e
+        _fail(logger, f"{_ERR} {e}", e, "Configure MCP command failed")
     except Exception as e:
-        console.print(f"[red]Unexpected error:[/red] {e}")
-        logger.error("Configure MCP command failed with unexpected error", error=str(e))
-        raise typer.Exit(1) from e
+        _fail(
+            logger,
+            f"[red]Unexpected error:[/red] {e}",
+            e,
+            "Configure MCP command failed with unexpected error",
+        )
+
+
+def _scan_dir(path: Path) -> dict[str, os.DirEntry[str]]:
+    """List a directory once, keyed by entry name; empty if it does not exist."""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry for entry in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+
+
+def _count_suffix(directory: Path, suffix: str) -> int:
+    """Count files, including symlinks to files, in a directory by suffix.
+
+    Returns:
+        Number of matching files, or -1 if the directory does not exist
+    """
+    try:
+        with os.scandir(directory) as it:
+            return sum(
+                1 for entry in it if entry.name.endswith(suffix) and entry.is_file()
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        return -1
+
+
+# A diagnostic row: (check, status, details)
+_CheckRow = tuple[str, str, str]
+# A per-agent check: (repo path, scanned root entries) -> (rows, issue keys)
+_AgentDiagnostic = Callable[
+    [Path, dict[str, os.DirEntry[str]]], tuple[list[_CheckRow], list[str]]
+]
+
+
+def _diagnose_claude(
+    repo_path: Path, root_entries: dict[str, os.DirEntry[str]]
+) -> tuple[list[_CheckRow], list[str]]:
+    """Check the Claude Code settings file and commands directory.
+
+    Args:
+        repo_path: Absolute path to the repository
+        root_entries: Scanned entries of the repository root
+
+    Returns:
+        The diagnostic rows and the issue keys found
+    """
+    rows: list[_CheckRow] = []
+    issues: list[str] = []
+    claude_entries = (
+        _scan_dir(repo_path / ".claude") if ".claude" in root_entries else {}
+    )
+
+    if "settings.json" in claude_entries:
+        rows.append((".claude/settings.json", "✓ Found", ""))
+    else:
+        rows.append((".claude/settings.json", "⚠ Missing", ""))
+        issues.append("claude_settings_missing")
+
+    command_count = (
+        _count_suffix(repo_path / ".claude" / "commands", ".md")
+        if "commands" in claude_entries
+        else -1
+    )
+    if command_count >= 0:
+        rows.append((".claude/commands/", "✓ Found", f"{command_count} commands"))
+    else:
+        rows.append((".claude/commands/", "- Not found", ""))
+
+    return rows, issues
+
+
+def _diagnose_cursor(
+    repo_path: Path, root_entries: dict[str, os.DirEntry[str]]
+) -> tuple[list[_CheckRow], list[str]]:
+    """Check the Cursor rules file, rules directory and commands directory.
+
+    Args:
+        repo_path: Absolute path to the repository
+        root_entries: Scanned entries of the repository root
+
+    Returns:
+        The diagnostic rows and the issue keys found
+    """
+    rows: list[_CheckRow] = []
+    issues: list[str] = []
+    has_cursor_dir = ".cursor" in root_entries
+    cursor_dir = repo_path / ".cursor"
+
+    if ".cursorrules" in root_entries:
+        rows.append((".cursorrules", "✓ Found", ""))
+    else:
+        rows.append((".cursorrules", "⚠ Missing", ""))
+        issues.append("cursor_rules_missing")
+
+    rule_count = _count_suffix(cursor_dir / "rules", ".mdc") if has_cursor_dir else -1
+    if rule_count >= 0:
+        rows.append((".cursor/rules/", "✓ Found", f"{rule_count} rule files"))
+    else:
+        rows.append((".cursor/rules/", "⚠ Missing", ""))
+
+    command_count = (
+        _count_suffix(cursor_dir / "commands", ".md") if has_cursor_dir else -1
+    )
+    if command_count >= 0:
+        rows.append((".cursor/commands/", "✓ Found", f"{command_count} commands"))
+    else:
+        rows.append((".cursor/commands/", "- Not found", ""))
+
+    return rows, issues
+
+
+# Per-agent doctor checks, keyed by agent type
+_AGENT_DIAGNOSTICS: dict[str, _AgentDiagnostic] = {
+    "claude-code": _diagnose_claude,
+    "cursor": _diagnose_cursor,
+}
 
 
 @app.command()
@@ -844,130 +1069,100 @@ def doctor(
 
     try:
         # Validate repository path
-        repo_path_obj = Path(repo_path).resolve()
-        if not repo_path_obj.exists():
-            console.print(
-                f"[red]Error:[/red] Repository path does not exist: {repo_path}"
-            )
+        if not os.path.exists(repo_path):
+            _cprint(f"{_ERR} Repository path does not exist: {repo_path}")
             raise typer.Exit(1)
+        repo_path_obj = Path(os.path.abspath(repo_path))
 
         # Validate agent type if provided
         if agent_type:
-            supported_agents = ["claude-code", "cursor"]
-            if agent_type not in supported_agents:
-                console.print(f"[red]Error:[/red] Unsupported agent type: {agent_type}")
-                console.print(
-                    f"[dim]Supported types: {', '.join(supported_agents)}[/dim]"
+            if agent_type not in _SUPPORTED_AGENTS:
+                _cprint(f"{_ERR} Unsupported agent type: {agent_type}")
+                _cprint(
+                    f"[dim]Supported types: {', '.join(_SUPPORTED_AGENT_NAMES)}[/dim]"
                 )
                 raise typer.Exit(1)
 
-        console.print(f"[cyan]Running diagnostics on {repo_path_obj}...[/cyan]")
+        _cprint(f"[cyan]Running diagnostics on {repo_path_obj}...[/cyan]")
 
         issues_found = []
         repairs_made = []
+        check_rows: list[tuple[str, str, str, str]] = []
 
         # Check agent-specific issues
-        agents_to_check = [agent_type] if agent_type else ["claude-code", "cursor"]
-
-        for agent in agents_to_check:
-            console.print(
-                f"\n[bold yellow]Checking {agent} configuration...[/bold yellow]"
-            )
-
-            if agent == "claude-code":
-                claude_settings = repo_path_obj / ".claude" / "settings.json"
-                claude_commands_dir = repo_path_obj / ".claude" / "commands"
-
-                if claude_settings.exists():
-                    console.print("  ✓ .claude/settings.json found")
-                else:
-                    console.print("  ⚠ .claude/settings.json missing")
-                    issues_found.append("claude_settings_missing")
-
-                if claude_commands_dir.exists():
-                    commands = list(claude_commands_dir.glob("*.md"))
-                    console.print(
-                        f"  ✓ .claude/commands/ directory found ({len(commands)} commands)"
-                    )
-                else:
-                    console.print("  - .claude/commands/ directory not found")
-
-            else:  # cursor
-                cursor_rules_file = repo_path_obj / ".cursorrules"
-                cursor_rules_dir = repo_path_obj / ".cursor" / "rules"
-                cursor_commands_dir = repo_path_obj / ".cursor" / "commands"
-
-                if cursor_rules_file.exists():
-                    console.print("  ✓ .cursorrules file found")
-                else:
-                    console.print("  ⚠ .cursorrules file missing")
-                    issues_found.append("cursor_rules_missing")
+        agents_to_check = (agent_type,) if agent_type else _SUPPORTED_AGENT_NAMES
 
-                if cursor_rules_dir.exists():
-                    rules = list(cursor_rules_dir.glob("*.mdc"))
-                    console.print(
-                        f"  ✓ .cursor/rules/ directory found ({len(rules)} rule files)"
-                    )
-                else:
-                    console.print("  ⚠ .cursor/rules/ directory missing")
+        root_entries = _scan_dir(repo_path_obj)
 
-                if cursor_commands_dir.exists():
-                    commands = list(cursor_commands_dir.glob("*.md"))
-                    console.print(
-                        f"  ✓ .cursor/commands/ directory found ({len(commands)} commands)"
-                    )
-                else:
-                    console.print("  - .cursor/commands/ directory not found")
+        for agent in agents_to_check:
+            rows, issues = _AGENT_DIAGNOSTICS[agent](repo_path_obj, root_entries)
+            check_rows.extend((agent, *row) for row in rows)
+            issues_found.extend(issues)
+
+        # Render all check results in a single table
+        table = Table(title="Diagnostics")
+        table.add_column("Agent", style="yellow")
+        table.add_column("Check", style="cyan")
+        table.add_column("Status", style="green")
+        table.add_column("Details", style="dim")
+        for row in check_rows:
+            _add_plain_row(table, *row)
+        console.print(table)
 
         # Attempt repairs if requested
         if repair and issues_found:
-            console.print(
+            _cprint(
                 f"\n[bold green]Attempting to repair {len(issues_found)} issues...[/bold green]"
             )
 
             for issue in issues_found:
                 if issue == "claude_settings_missing":
-                    console.print("  Suggested fix:")
-                    console.print(
+                    _cprint("  Suggested fix:")
+                    _cprint(
                         "    Suggested fix: Run 'bob configure-defaults --agent-type claude-code --template-type development-team'"
                     )
-                    console.print(
+                    _cprint(
                         "    Or choose from: solo-developer, development-team, enterprise-security"
                     )
                     repairs_made.append("claude_rules_suggestion")
 
                 elif issue == "cursor_rules_missing":
-                    console.print("  Suggested fix:")
-                    console.print(
+                    _cprint("  Suggested fix:")
+                    _cprint(
                         "    Suggested fix: Run 'bob configure-defaults --agent-type cursor --template-type development-team'"
                     )
-                    console.print(
+                    _cprint(
                         "    Or choose from: solo-developer, development-team, enterprise-security"
                     )
                     repairs_made.append("cursor_rules_suggestion")
 
         # Summary
         if not issues_found:
-            console.print(
+            _cprint(
                 "\n[bold green]✓ No issues found! Your setup looks good.[/bold green]"
             )
         else:
-            console.print(
-                f"\n[bold yellow]Found {len(issues_found)} issues[/bold yellow]"
-            )
+            _cprint(f"\n[bold yellow]Found {len(issues_found)} issues[/bold yellow]")
             if repair:
-                console.print(
-                    f"[dim]Suggested {len(repairs_made)} repair actions[/dim]"
-                )
+                _cprint(f"[dim]Suggested {len(repairs_made)} repair actions[/dim]")
             else:
-                console.print("[dim]Run with --repair to see suggested fixes[/dim]")
+                _cprint("[dim]Run with --repair to see suggested fixes[/dim]")
 
         logger.info("Doctor command completed successfully")
 
     except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        logger.error("Doctor command failed", error=str(e))
-        raise typer.Exit(1) from e
+        _fail(logger, f"{_ERR} {e}", e, "Doctor command failed")
+
+
+@functools.lru_cache(maxsize=1)
+def _template_engine() -> "TemplateEngine":
+    """Return the shared engine for the bundled templates, created on first use."""
+    # jinja2/yaml are only loaded by the commands that render templates
+    from bob_the_engineer.adapters.template_engine import (  # noqa: PLC0415
+        TemplateEngine,
+    )
+
+    return TemplateEngine(Path(str(files("bob_the_engineer") / "templates")))
 
 
 @app.command()
@@ -1003,27 +1198,23 @@ def init(
 
     try:
         # Validate agent type
-        supported_agents = ["claude-code", "cursor"]
-        if agent_type not in supported_agents:
-            console.print(f"[red]Error:[/red] Unsupported agent type: {agent_type}")
-            console.print(f"[dim]Supported types: {', '.join(supported_agents)}[/dim]")
+        if agent_type not in _SUPPORTED_AGENTS:
+            _cprint(f"{_ERR} Unsupported agent type: {agent_type}")
+            _cprint(f"[dim]Supported types: {', '.join(_SUPPORTED_AGENT_NAMES)}[/dim]")
             raise typer.Exit(1)
 
         # Validate repository path
-        repo_path_obj = Path(target_path).resolve()
-        if not repo_path_obj.exists():
-            console.print(
-                f"[red]Error:[/red] Repository path does not exist: {target_path}"
-            )
+        if not os.path.exists(target_path):
+            _cprint(f"{_ERR} Repository path does not exist: {target_path}")
             raise typer.Exit(1)
+        repo_path_obj = Path(os.path.abspath(target_path))
 
         # Determine what to install
         install_subagents = not workflows_only or subagents_only or subagent
         install_workflows = not subagents_only or workflows_only or workflow
 
         # Get available items
-        templates_dir = Path(__file__).parent.parent / "templates"
-        template_engine = TemplateEngine(templates_dir)
+        template_engine = _template_engine()
         available_subagents = template_engine.list_available_subagents()
         available_workflows = template_engine.list_available_workflows()
 
@@ -1036,83 +1227,83 @@ def init(
         )
 
         if dry_run:
-            console.print(f"[yellow]Dry run for {agent_type} initialization[/yellow]")
-            console.print(f"[dim]Target directory: {repo_path_obj}[/dim]")
+            _cprint(f"[yellow]Dry run for {agent_type} initialization[/yellow]")
+            _cprint(f"[dim]Target directory: {repo_path_obj}[/dim]")
 
             if subagents_to_install:
-                console.print(
+                _cprint(
                     f"[green]Subagents to install ({len(subagents_to_install)}):[/green]"
                 )
                 for sub in subagents_to_install:
-                    console.print(f"  [dim]→[/dim] {sub}")
+                    _cprint(f"  [dim]→[/dim] {sub}")
 
             if workflows_to_install:
-                console.print(
+                _cprint(
                     f"[green]Workflows to install ({len(workflows_to_install)}):[/green]"
                 )
                 for wf in workflows_to_install:
-                    console.print(f"  [dim]→[/dim] {wf}")
+                    _cprint(f"  [dim]→[/dim] {wf}")
 
-            console.print("[dim]" + "=" * 80 + "[/dim]")
-            console.print(
+            _cprint("[dim]" + "=" * 80 + "[/dim]")
+            _cprint(
                 "[yellow]Dry run complete. Use without --dry-run to initialize.[/yellow]"
             )
         else:
             # Initialize the coding agent environment
-            console.print(f"[cyan]Initializing {agent_type} environment...[/cyan]")
+            _cprint(f"[cyan]Initializing {agent_type} environment...[/cyan]")
 
             all_output_paths = []
 
             # Install subagents
             if subagents_to_install:
-                console.print(
+                _cprint(
                     f"[cyan]Installing {len(subagents_to_install)} subagents for {agent_type}...[/cyan]"
                 )
-                for subagent_name in subagents_to_install:
-                    try:
-                        output_paths = template_engine.generate_subagent_rules(
-                            subagent_name, agent_type, repo_path_obj
-                        )
-                        all_output_paths.extend(output_paths)
-                        console.print(f"  [green]✓[/green] {subagent_name}")
-                    except Exception as e:
-                        console.print(f"  [red]✗[/red] {subagent_name}: {e}")
+                for subagent_name, result in template_engine.generate_subagents(
+                    subagents_to_install, agent_type, repo_path_obj
+                ):
+                    if isinstance(result, Exception):
+                        _cprint(f"  {_FAIL} {subagent_name}: {result}")
+                    else:
+                        all_output_paths.append(result)
+                        _cprint(f"  {_OK} {subagent_name}")
 
             # Install workflows
             if workflows_to_install:
-                console.print(
+                _cprint(
                     f"[cyan]Installing {len(workflows_to_install)} workflows for {agent_type}...[/cyan]"
                 )
-                for workflow_name in workflows_to_install:
-                    try:
-                        output_paths = template_engine.install_coding_workflows(
-                            [workflow_name], agent_type, repo_path_obj
-                        )
-                        all_output_paths.extend(output_paths)
-                        console.print(f"  [green]✓[/green] {workflow_name}")
-                    except Exception as e:
-                        console.print(f"  [red]✗[/red] {workflow_name}: {e}")
+                for workflow_name, result in template_engine.generate_workflows(
+                    workflows_to_install, agent_type, repo_path_obj
+                ):
+                    if isinstance(result, Exception):
+                        _cprint(f"  {_FAIL} {workflow_name}: {result}")
+                    else:
+                        all_output_paths.append(result)
+                        _cprint(f"  {_OK} {workflow_name}")
 
             # Success summary
             if all_output_paths:
-                console.print(
+                _cprint(
                     f"\n[green]✓ Successfully initialized {agent_type} environment![/green]"
                 )
-                console.print(f"[dim]Created {len(all_output_paths)} files:[/dim]")
+                _cprint(f"[dim]Created {len(all_output_paths)} files:[/dim]")
+                # Outputs are built from repo_path_obj, so a string prefix
+                # check is enough to make them relative
+                root_prefix = os.path.join(repo_path_obj, "")
                 for path in all_output_paths:
+                    path_str = str(path)
                     rel_path = (
-                        path.relative_to(repo_path_obj)
-                        if path.is_relative_to(repo_path_obj)
-                        else path
+                        path_str[len(root_prefix) :]
+                        if path_str.startswith(root_prefix)
+                        else path_str
                     )
-                    console.print(f"  [dim]→[/dim] {rel_path}")
+                    _cprint(f"  [dim]→[/dim] {rel_path}")
             else:
-                console.print("[yellow]No files were created.[/yellow]")
+                _cprint("[yellow]No files were created.[/yellow]")
 
     except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        logger.error("Init command failed", error=str(e))
-        raise typer.Exit(1) from e
+        _fail(logger, f"{_ERR} {e}", e, "Init command failed")
 
 
 if __name__ == "__main__":
@@ -1,37 +1,29 @@
 """Logging configuration for bob-the-engineer CLI."""
 
+import functools
 import logging
+import os
 import sys
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
-import structlog
-
 if TYPE_CHECKING:
-    pass
+    import structlog
 
 
-def configure_logging(
-    log_level: str = "INFO",
-    log_file: Path | None = None,
-    enable_json: bool = False,
-) -> None:
-    """Configure structured logging for the CLI application.
+@functools.lru_cache(maxsize=8)
+def _build_processors(
+    log_level: str, enable_json: bool, colors: bool
+) -> tuple[Any, ...]:
+    """Build the structlog processor chain once per (level, json, colors).
 
     Args:
-        log_level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-        log_file: Optional file path to write logs to
+        log_level: Upper-cased log level name
         enable_json: Whether to output JSON structured logs
+        colors: Whether the console renderer should emit ANSI colors
     """
+    import structlog  # noqa: PLC0415 - deferred for startup time
 
-    # Configure standard library logging
-    logging.basicConfig(
-        format="%(message)s",
-        level=getattr(logging, log_level.upper()),
-        handlers=[],
-    )
-
-    # Configure structlog
     processors: list[Any] = [
         # Add timestamp
         structlog.processors.TimeStamper(fmt="ISO"),
@@ -40,7 +32,7 @@ def configure_logging(
         # Add function name and line number in debug mode
         structlog.processors.CallsiteParameterAdder(
             parameters=[structlog.processors.CallsiteParameter.FUNC_NAME]
-            if log_level.upper() == "DEBUG"
+            if log_level == "DEBUG"
             else []
         ),
     ]
@@ -55,25 +47,64 @@ def configure_logging(
                 structlog.processors.StackInfoRenderer(),
                 structlog.dev.set_exc_info,
                 structlog.dev.ConsoleRenderer(
-                    colors=sys.stderr.isatty(),  # Only use colors in interactive terminals
+                    colors=colors,
                     exception_formatter=structlog.dev.rich_traceback,
                 ),
             ]
         )
 
-    # Configure structlog
+    return tuple(processors)
+
+
+@functools.lru_cache(maxsize=1)
+def _configure_structlog(log_level: str, enable_json: bool, colors: bool) -> None:
+    """Apply the structlog configuration; a no-op if the settings are unchanged."""
+    import structlog  # noqa: PLC0415 - deferred for startup time
+
+    get_logger.cache_clear()
     structlog.configure(
-        processors=processors,
+        processors=list(_build_processors(log_level, enable_json, colors)),
         wrapper_class=structlog.make_filtering_bound_logger(
-            getattr(logging, log_level.upper())
+            getattr(logging, log_level)
         ),
         logger_factory=structlog.stdlib.LoggerFactory(),
-        context_class=structlog.threadlocal.wrap_dict(dict),
+        context_class=dict,
         cache_logger_on_first_use=True,
     )
 
-    # Set up file logging if requested
-    if log_file:
+
+def configure_logging(
+    log_level: str = "INFO",
+    log_file: Path | None = None,
+    enable_json: bool = False,
+) -> None:
+    """Configure structured logging for the CLI application.
+
+    Args:
+        log_level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        log_file: Optional file path to write logs to
+        enable_json: Whether to output JSON structured logs
+    """
+    log_level = log_level.upper()
+
+    # Configure standard library logging
+    logging.basicConfig(
+        format="%(message)s",
+        level=getattr(logging, log_level),
+        handlers=[],
+    )
+
+    # Configure structlog (only use colors in interactive terminals)
+    _configure_structlog(log_level, enable_json, sys.stderr.isatty())
+
+    # Set up file logging if requested, once per file: re-entry must not
+    # stack handlers that would write every record to the same file again
+    root_logger = logging.getLogger()
+    if log_file and not any(
+        isinstance(handler, logging.FileHandler)
+        and handler.baseFilename == os.path.abspath(log_file)
+        for handler in root_logger.handlers
+    ):
         log_file.parent.mkdir(parents=True, exist_ok=True)
         file_handler = logging.FileHandler(log_file)
         file_handler.setFormatter(
@@ -82,12 +113,19 @@ def configure_logging(
                 datefmt="%Y-%m-%d %H:%M:%S",
             )
         )
-        logging.getLogger().addHandler(file_handler)
+        root_logger.addHandler(file_handler)
+
 
+@functools.lru_cache(maxsize=128)
+def get_logger(name: str) -> "structlog.BoundLogger":
+    """Get a configured logger for the given name.
+
+    Loggers are memoized per name; configure_logging clears the cache so a
+    reconfiguration is never masked by a logger bound to the old settings.
+    """
+    import structlog  # noqa: PLC0415 - deferred for startup time
 
-def get_logger(name: str) -> structlog.BoundLogger:
-    """Get a configured logger for the given name."""
-    return cast(structlog.BoundLogger, structlog.get_logger(name))
+    return cast("structlog.BoundLogger", structlog.get_logger(name))
 
 
 # CLI logging utilities
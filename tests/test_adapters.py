@@ -1,10 +1,17 @@
 """Tests for the adapter template system."""
 
+import json
+from pathlib import Path
+
 import pytest
 
+import bob_the_engineer
+from bob_the_engineer import _json as json_helpers
+from bob_the_engineer._json import dumps_json
 from bob_the_engineer.adapters.claude.rules_manager import ClaudeRulesManager
 from bob_the_engineer.adapters.cursor.rules_manager import CursorRulesManager
 from bob_the_engineer.adapters.factory import AdapterFactory
+from bob_the_engineer.adapters.template_engine import TemplateEngine
 
 
 class TestAdapterFactory:
@@ -66,6 +73,27 @@ class TestClaudeRulesManager:
         assert output_file.exists()
         assert output_file.read_text() == test_content
 
+    def test_load_settings_template(self):
+        """Test loading a bundled settings template by name."""
+        template = ClaudeRulesManager.load_settings_template("vibe_coder")
+        assert "_template_info" in template
+
+        # Each load returns an independent copy of the cached template
+        template.clear()
+        assert ClaudeRulesManager.load_settings_template("vibe_coder")
+
+    def test_list_available_templates(self):
+        """Test bundled templates are listed once, as a sorted tuple."""
+        templates = ClaudeRulesManager.list_available_templates()
+        assert [t.name for t in templates] == sorted(t.name for t in templates)
+        assert any(t.name == "claude_vibe_coder.json" for t in templates)
+        assert ClaudeRulesManager.list_available_templates() is templates
+
+    def test_load_unknown_settings_template(self):
+        """Test that unknown template names list the available templates."""
+        with pytest.raises(FileNotFoundError, match="vibe_coder"):
+            ClaudeRulesManager.load_settings_template("does_not_exist")
+
 
 class TestCursorRulesManager:
     """Test Cursor rules manager."""
@@ -87,3 +115,54 @@ class TestCursorRulesManager:
         cursor_rules_dir = tmp_path / ".cursor" / "rules"
         assert cursor_rules_dir.exists()
         assert (cursor_rules_dir / "coding-agent-rules.mdc").exists()
+
+    def test_install_ai_commands_merges_existing(self, tmp_path):
+        """Test AI commands are added to an existing file without duplicates."""
+        commands_file = tmp_path / "ai-commands.json"
+        commands_file.write_text(json.dumps([{"name": "safe-commit"}]))
+
+        CursorRulesManager(tmp_path).install_ai_commands()
+        CursorRulesManager(tmp_path).install_ai_commands()
+
+        names = [cmd["name"] for cmd in json.loads(commands_file.read_text())]
+        assert names.count("safe-commit") == 1
+        assert "run-tests" in names
+
+
+class TestTemplateEngine:
+    """Test TemplateEngine."""
+
+    def test_list_available_subagents(self, tmp_path):
+        """Test subagent names are listed sorted, without the template suffix."""
+        subagents_dir = tmp_path / "subagents"
+        subagents_dir.mkdir()
+        (subagents_dir / "b_agent.jinja2.md").write_text("B")
+        (subagents_dir / "a_agent.jinja2.md").write_text("A")
+        (subagents_dir / "notes.md").write_text("not a template")
+
+        engine = TemplateEngine(tmp_path)
+        assert engine.list_available_subagents() == ["a_agent", "b_agent"]
+        assert engine.list_available_workflows() == []
+
+    def test_load_agent_config_returns_copies(self):
+        """Test agent configs are cached but each caller gets its own copy."""
+        engine = TemplateEngine(Path(bob_the_engineer.__file__).parent / "templates")
+        config = engine.load_agent_config("claude-code")
+        config.clear()
+        assert engine.load_agent_config("claude-code")
+
+        with pytest.raises(FileNotFoundError):
+            engine.load_agent_config("emacs")
+
+
+class TestJsonHelpers:
+    """Test the shared JSON helpers."""
+
+    def test_dumps_json_matches_without_orjson(self, monkeypatch):
+        """Test the stdlib fallback writes the same JSON as the orjson path."""
+        data = {"k": "✓ café", "n": [1, 2]}
+        expected = json.dumps(data, indent=2, ensure_ascii=False)
+        assert dumps_json(data) == expected
+
+        monkeypatch.setattr(json_helpers, "orjson", None)
+        assert dumps_json(data) == expected